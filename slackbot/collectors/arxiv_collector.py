@@ -8,10 +8,10 @@ Specialized for academic and research content.
 
 import logging
 import hashlib
-import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 # Third-party imports
 try:
@@ -27,8 +27,15 @@ from .base_collector import BaseCollector
 
 logger = logging.getLogger(__name__)
 
+# arXiv asks API clients to wait ~3 s between requests; the arxiv client enforces this between pages
+ARXIV_DELAY_SECONDS = 3.0
+ARXIV_NUM_RETRIES = 3
 
-@dataclass
+# Number of content hashes remembered for deduplication; the oldest are evicted first
+ARXIV_CACHE_SIZE = 1000
+
+
+@dataclass(slots=True)
 class ArXivSource:
     """Represents a configurable ArXiv source."""
 
@@ -44,9 +51,17 @@ class ArXivSource:
 
     def to_dict(self) -> Dict:
         """Convert source to dictionary for serialization."""
-        data = asdict(self)
-        if self.last_fetch:
-            data["last_fetch"] = self.last_fetch.isoformat()
+        data = {
+            "name": self.name,
+            "query": self.query,
+            "enabled": self.enabled,
+            "max_results": self.max_results,
+            "sort_by": self.sort_by,
+            "sort_order": self.sort_order,
+            "category": self.category,
+            "update_interval": self.update_interval,
+            "last_fetch": self.last_fetch.isoformat() if self.last_fetch else None,
+        }
         return data
 
     @classmethod
@@ -69,7 +84,7 @@ class ArXivSource:
         return source
 
 
-@dataclass
+@dataclass(slots=True)
 class ArXivPaper:
     """Represents an ArXiv research paper."""
 
@@ -84,7 +99,16 @@ class ArXivPaper:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            "title": self.title,
+            "url": self.url,
+            "source": self.source,
+            "category": self.category,
+            "summary": self.summary,
+            "published_at": self.published_at,
+            "content": self.content,
+            "api_data": self.api_data,
+        }
 
 
 class ArXivCollector(BaseCollector):
@@ -94,7 +118,7 @@ class ArXivCollector(BaseCollector):
         super().__init__(name=name)
 
         self.sources = []
-        self.papers_cache = {}  # Cache for deduplication
+        self.papers_cache: OrderedDict[str, None] = OrderedDict()  # Content hashes for deduplication
         self.arxiv_client = None
 
         # Load default ArXiv sources
@@ -103,9 +127,13 @@ class ArXivCollector(BaseCollector):
 
     def initialize_arxiv_client(self):
         """Initialize ArXiv client."""
+        if not DEPENDENCIES_AVAILABLE:
+            logger.warning("arxiv package not installed. ArXiv features will be disabled.")
+            return
+
         try:
-            # ArXiv doesn't require an API key
-            self.arxiv_client = True  # Just mark as available
+            # ArXiv doesn't require an API key; one client is shared so its request pacing spans all sources
+            self.arxiv_client = arxiv.Client(delay_seconds=ARXIV_DELAY_SECONDS, num_retries=ARXIV_NUM_RETRIES)
             logger.info("ArXiv client available")
         except Exception as e:
             logger.error("Error initializing ArXiv client: %s", e)
@@ -162,9 +190,14 @@ class ArXivCollector(BaseCollector):
         time_since_last = datetime.now() - source.last_fetch
         return time_since_last.total_seconds() >= source.update_interval
 
-    def generate_content_hash(self, content: str) -> str:
-        """Generate a hash for content deduplication."""
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+    def generate_content_hash(self, *parts: str) -> str:
+        """Generate a hash for content deduplication from one or more text parts."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for index, part in enumerate(parts):
+            if index:
+                hasher.update(b" ")
+            hasher.update(part.encode("utf-8"))
+        return hasher.hexdigest()
 
     def fetch_papers(self, source: ArXivSource) -> List[ArXivPaper]:
         """Fetch papers from ArXiv API."""
@@ -174,7 +207,6 @@ class ArXivCollector(BaseCollector):
 
         try:
             # Create search query using the newer Client approach
-            client = arxiv.Client()
             search = arxiv.Search(
                 query=source.query,
                 max_results=min(source.max_results, 20),  # Limit to avoid pagination issues
@@ -183,10 +215,9 @@ class ArXivCollector(BaseCollector):
             )
 
             papers = []
-            for result in client.results(search):
+            for result in self.arxiv_client.results(search):
                 # Generate content hash for deduplication
-                content = f"{result.title} {result.summary}"
-                content_hash = self.generate_content_hash(content)
+                content_hash = self.generate_content_hash(result.title, result.summary)
 
                 # Check if we've seen this content before
                 if content_hash in self.papers_cache:
@@ -210,10 +241,9 @@ class ArXivCollector(BaseCollector):
                 )
 
                 papers.append(paper)
-                self.papers_cache[content_hash] = paper
-
-                # Rate limiting
-                time.sleep(0.1)
+                self.papers_cache[content_hash] = None
+                if len(self.papers_cache) > ARXIV_CACHE_SIZE:
+                    self.papers_cache.popitem(last=False)
 
             logger.info("Fetched %s papers from %s", len(papers), source.name)
             return papers
@@ -229,6 +259,7 @@ class ArXivCollector(BaseCollector):
     def collect(self, **kwargs) -> List[Dict[str, Any]]:
         """Collect papers from all enabled ArXiv sources."""
         all_papers = []
+        collected_at = datetime.now().isoformat()  # One timestamp per collection run
 
         for source in self.sources:
             if not source.enabled:
@@ -245,7 +276,7 @@ class ArXivCollector(BaseCollector):
                 for paper in papers:
                     paper_dict = paper.to_dict()
                     paper_dict["collector"] = self.name
-                    paper_dict["collected_at"] = datetime.now().isoformat()
+                    paper_dict["collected_at"] = collected_at
                     paper_dict["source_type"] = "arxiv"  # Add source type for compatibility
                     all_papers.append(paper_dict)
 
@@ -286,15 +317,6 @@ class ArXivCollector(BaseCollector):
                 logger.info("Disabled ArXiv source: %s", name)
                 break
 
-    def cleanup_cache(self):
-        """Clean up old items from cache to prevent memory issues."""
-        # Keep only the last 1000 items
-        if len(self.papers_cache) > 1000:
-            # Remove oldest items (simple approach: keep last 1000)
-            cache_items = list(self.papers_cache.items())
-            self.papers_cache = dict(cache_items[-1000:])
-            logger.info("Cleaned up ArXiv cache, kept last 1000 items")
-
 
 def create_arxiv_collector(name: str = "ArXiv Collector") -> ArXivCollector:
     """Factory function to create an ArXiv collector instance."""
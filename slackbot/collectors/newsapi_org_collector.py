@@ -9,13 +9,18 @@ Specialized for general news content and current events.
 import os
 import logging
 import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
 # Third-party imports
 try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from newsapi import NewsApiClient
 
     DEPENDENCIES_AVAILABLE = True
@@ -28,6 +33,18 @@ from .base_collector import BaseCollector
 
 logger = logging.getLogger(__name__)
 
+# Connection pool size for the shared NewsAPI HTTP session (all requests go to newsapi.org)
+NEWSAPI_POOL_SIZE = 8
+
+# Transient failures are retried at the transport layer with exponential backoff
+NEWSAPI_MAX_RETRIES = 3
+NEWSAPI_RETRY_BACKOFF = 0.3
+# 429 is not retried: NewsAPI sends it when the key's request quota is used up, so a retry cannot succeed
+NEWSAPI_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Number of content hashes and URLs remembered for deduplication; the oldest are evicted first
+NEWSAPI_CACHE_SIZE = 1000
+
 
 class Category(Enum):
     """News categories for structured querying."""
@@ -119,7 +136,7 @@ NEWS_QUERY_PARAMS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsAPISource:
     """Represents a configurable NewsAPI source."""
 
@@ -136,9 +153,18 @@ class NewsAPISource:
 
     def to_dict(self) -> Dict:
         """Convert source to dictionary for serialization."""
-        data = asdict(self)
-        if self.last_fetch:
-            data["last_fetch"] = self.last_fetch.isoformat()
+        data = {
+            "name": self.name,
+            "query": self.query,
+            "enabled": self.enabled,
+            "max_items": self.max_items,
+            "category": self.category,
+            "language": self.language,
+            "country": self.country,
+            "domains": self.domains,
+            "update_interval": self.update_interval,
+            "last_fetch": self.last_fetch.isoformat() if self.last_fetch else None,
+        }
         return data
 
     @classmethod
@@ -162,7 +188,7 @@ class NewsAPISource:
         return source
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsAPIArticle:
     """Represents a NewsAPI article."""
 
@@ -177,18 +203,35 @@ class NewsAPIArticle:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            "title": self.title,
+            "url": self.url,
+            "source": self.source,
+            "category": self.category,
+            "summary": self.summary,
+            "published_at": self.published_at,
+            "content": self.content,
+            "api_data": self.api_data,
+        }
 
 
 class NewsAPICollector(BaseCollector):
     """NewsAPI.org news collector service."""
 
-    def __init__(self, name: str = "NewsAPI Collector"):
+    def __init__(self, name: str = "NewsAPI Collector", api_key: Optional[str] = None):
         super().__init__(name=name)
 
+        # Read the key once; re-initialization reuses it instead of consulting the environment again
+        self.api_key = api_key or os.getenv("NEWSAPI_KEY")
         self.sources = []
-        self.articles_cache = {}  # Cache for deduplication
+        self.articles_cache: OrderedDict[str, None] = OrderedDict()  # Content hashes for deduplication
+        self.seen_urls: OrderedDict[str, None] = OrderedDict()  # URLs already collected, for O(1) URL dedup
         self.newsapi_client = None
+        self.session = None
+        # Keywords are per category, so keep one lookup instead of copying them onto every article
+        self.keywords_by_category: Dict[str, List[str]] = {
+            category.value: params["keywords"] for category, params in NEWS_QUERY_PARAMS.items()
+        }
 
         # Load default NewsAPI sources
         self.load_default_sources()
@@ -198,12 +241,24 @@ class NewsAPICollector(BaseCollector):
         """Initialize NewsAPI client."""
         try:
             # Initialize NewsAPI client
-            newsapi_key = os.getenv("NEWSAPI_KEY")
-            if newsapi_key:
-                self.newsapi_client = NewsApiClient(api_key=newsapi_key)
+            if self.api_key:
+                # Reuse one keep-alive session so repeated queries skip the TCP/TLS handshake
+                self.session = requests.Session()
+                retries = Retry(
+                    total=NEWSAPI_MAX_RETRIES,
+                    backoff_factor=NEWSAPI_RETRY_BACKOFF,
+                    status_forcelist=NEWSAPI_RETRY_STATUSES,
+                    raise_on_status=False,  # Hand the final error response to newsapi-python to report
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=NEWSAPI_POOL_SIZE, max_retries=retries)
+                self.session.mount("https://", adapter)
+                self.newsapi_client = NewsApiClient(api_key=self.api_key, session=self.session)
                 logger.info("NewsAPI client initialized successfully")
             else:
-                logger.warning("NEWSAPI_KEY environment variable not set. NewsAPI features will be disabled.")
+                logger.warning(
+                    "No NewsAPI key provided (api_key argument or NEWSAPI_KEY environment variable). "
+                    "NewsAPI features will be disabled."
+                )
 
         except Exception as e:
             logger.error("Error initializing NewsAPI client: %s", e)
@@ -240,15 +295,27 @@ class NewsAPICollector(BaseCollector):
         time_since_last = datetime.now() - source.last_fetch
         return time_since_last.total_seconds() >= source.update_interval
 
-    def generate_content_hash(self, content: str) -> str:
-        """Generate a hash for content deduplication."""
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+    def generate_content_hash(self, *parts: str) -> str:
+        """Generate a hash for content deduplication from one or more text parts."""
+        hasher = hashlib.blake2b(digest_size=16)
+        for index, part in enumerate(parts):
+            if index:
+                hasher.update(b" ")
+            hasher.update(part.encode("utf-8"))
+        return hasher.hexdigest()
 
     def fetch_articles(self, source: NewsAPISource) -> List[NewsAPIArticle]:
         """Fetch articles from NewsAPI."""
+        response = self._query_articles(source)
+        if response is None:
+            return []
+        return self._dedupe_articles(source, response)
+
+    def _query_articles(self, source: NewsAPISource) -> Optional[Dict[str, Any]]:
+        """Run the NewsAPI query for a source and return the raw response, or None on failure."""
         if not self.newsapi_client:
             logger.warning("NewsAPI client not available")
-            return []
+            return None
 
         try:
             # Build query parameters - NewsAPI requires at least a query or category
@@ -264,12 +331,10 @@ class NewsAPICollector(BaseCollector):
                 # Default query if neither is specified
                 params["q"] = "artificial intelligence"
 
-            if source.category:
-                params["category"] = source.category
+            # category and country are top-headlines filters that get_everything rejects,
+            # so only the parameters /everything accepts are sent
             if source.language:
                 params["language"] = source.language
-            if source.country:
-                params["country"] = source.country
             if source.domains:
                 params["domains"] = source.domains
 
@@ -279,11 +344,7 @@ class NewsAPICollector(BaseCollector):
             logger.info("NewsAPI params for %s: %s", source.name, params)
 
             # Use get_everything for all categories like the POC approach
-            # Remove country parameter as it's not supported by get_everything
-            params_for_everything = params.copy()
-            params_for_everything.pop("country", None)  # country is not supported by get_everything
-            params_for_everything.pop("category", None)  # Remove category as we use custom queries
-            response = self.newsapi_client.get_everything(**params_for_everything, sort_by="publishedAt")
+            response = self.newsapi_client.get_everything(**params, sort_by="publishedAt")
 
             # Log response status for debugging
             logger.info(
@@ -296,53 +357,91 @@ class NewsAPICollector(BaseCollector):
 
             if response.get("status") != "ok":
                 logger.warning("NewsAPI error for %s: %s", source.name, response.get("message", "Unknown error"))
-                logger.info("Full response: %s", response)
-                return []
+                logger.debug("Full response: %s", response)
+                return None
+
+            return response
 
-            articles = []
+        except Exception as e:
+            logger.error("Error fetching from NewsAPI %s: %s", source.name, e)
+            logger.debug("Traceback for NewsAPI %s failure", source.name, exc_info=True)
+            return None
+
+    def _dedupe_articles(self, source: NewsAPISource, response: Dict[str, Any]) -> List[NewsAPIArticle]:
+        """
+        Build articles from a NewsAPI response, skipping ones already collected.
+
+        Must run on the calling thread in source order, so that an article returned by
+        several queries is always attributed to the first source that returned it.
+        """
+        articles = []
+        try:
             for article in response.get("articles", []):
+                # Articles without a title or link cannot be deduplicated or published
+                title = article.get("title")
+                url = article.get("url")
+                if not (title and url):
+                    continue
+                description = article.get("description") or ""
+
                 # Generate content hash for deduplication
-                content = f"{article.get('title', '')} {article.get('description', '')}"
-                content_hash = self.generate_content_hash(content)
+                content_hash = self.generate_content_hash(title, description)
 
-                # Check if we've seen this content before
-                if content_hash in self.articles_cache:
+                # Check if we've seen this content or link before
+                if content_hash in self.articles_cache or url in self.seen_urls:
                     continue
 
+                self.articles_cache[content_hash] = None
+                self.seen_urls[url] = None
+                if len(self.articles_cache) > NEWSAPI_CACHE_SIZE:
+                    self.articles_cache.popitem(last=False)
+                if len(self.seen_urls) > NEWSAPI_CACHE_SIZE:
+                    self.seen_urls.popitem(last=False)
+
                 # Create news item
                 news_item = NewsAPIArticle(
-                    title=article.get("title", "No Title"),
-                    url=article.get("url", ""),
+                    title=title,
+                    url=url,
                     source=source.name,
                     category=source.category or "General",
-                    summary=article.get("description", "No description available"),
-                    published_at=article.get("publishedAt", ""),
-                    content=article.get("content", ""),
+                    summary=description or "No description available",
+                    published_at=article.get("publishedAt") or "",
+                    content=article.get("content") or "",
                     api_data={
                         "author": article.get("author"),
-                        "source_name": article.get("source", {}).get("name"),
+                        "source_name": (article.get("source") or {}).get("name"),
                         "url_to_image": article.get("urlToImage"),
                         "content_hash": content_hash,
                     },
                 )
 
                 articles.append(news_item)
-                self.articles_cache[content_hash] = news_item
-
-            logger.info("Fetched %s articles from %s", len(articles), source.name)
-            return articles
 
         except Exception as e:
-            logger.error("Error fetching from NewsAPI %s: %s", source.name, e)
-            import traceback
-
-            logger.debug("Traceback: %s", traceback.format_exc())
-            return []
+            logger.error("Error processing NewsAPI articles from %s: %s", source.name, e)
+            logger.debug("Traceback for NewsAPI %s failure", source.name, exc_info=True)
+
+        logger.info("Fetched %s articles from %s", len(articles), source.name)
+        return articles
+
+    def _build_article_dict(
+        self, article: NewsAPIArticle, collected_at: str, category: Optional[Category] = None
+    ) -> Dict[str, Any]:
+        """Convert a fetched article to the dict shape shared by all collection paths."""
+        article_dict = article.to_dict()
+        if category is not None:
+            article_dict["category"] = category.value
+        article_dict["collector"] = self.name
+        article_dict["collected_at"] = collected_at
+        article_dict["source_type"] = "newsapi"  # Add source type for compatibility
+        return article_dict
 
     def collect(self, **kwargs) -> List[Dict[str, Any]]:
         """Collect articles from all enabled NewsAPI sources."""
         all_articles = []
+        collected_at = datetime.now().isoformat()  # One timestamp per collection run
 
+        due_sources = []
         for source in self.sources:
             if not source.enabled:
                 continue
@@ -351,16 +450,23 @@ class NewsAPICollector(BaseCollector):
                 logger.debug("Skipping source %s - not due for update", source.name)
                 continue
 
+            due_sources.append(source)
+
+        # Only the network queries run concurrently; deduplication below walks the results in
+        # source order, so an article returned by several sources is attributed to the first one
+        futures = []
+        if due_sources:
+            workers = min(len(due_sources), NEWSAPI_POOL_SIZE)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="newsapi") as executor:
+                futures = [(source, executor.submit(self._query_articles, source)) for source in due_sources]
+
+        for source, future in futures:
             try:
-                articles = self.fetch_articles(source)
+                response = future.result()
+                articles = self._dedupe_articles(source, response) if response else []
                 source.last_fetch = datetime.now()
 
-                for article in articles:
-                    article_dict = article.to_dict()
-                    article_dict["collector"] = self.name
-                    article_dict["collected_at"] = datetime.now().isoformat()
-                    article_dict["source_type"] = "newsapi"  # Add source type for compatibility
-                    all_articles.append(article_dict)
+                all_articles.extend(self._build_article_dict(article, collected_at) for article in articles)
 
             except Exception as e:
                 logger.error("Error collecting from source %s: %s", source.name, e)
@@ -409,39 +515,44 @@ class NewsAPICollector(BaseCollector):
         logger.info("=== Fetching News by Categories ===")
 
         # Clear cache to avoid deduplication issues with categorized fetching
-        original_cache_size = len(self.articles_cache)
-        self.articles_cache.clear()
+        original_cache_size = self.clear_cache()
         logger.info("Cleared cache (was %s items) for categorized fetching", original_cache_size)
 
         all_articles = []
         total_articles = 0
+        collected_at = datetime.now().isoformat()
+
+        if not query_params:
+            return all_articles
+
+        # Only the network queries run concurrently; deduplication below walks the results in
+        # query_params order, so an article shared by several categories lands in the first one
+        workers = min(len(query_params), NEWSAPI_POOL_SIZE)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="newsapi") as executor:
+            futures = []
+            for category, params in query_params.items():
+                self.keywords_by_category[category.value] = params["keywords"]
+                logger.info("--- Fetching %s News ---", category.value.upper())
+                logger.info("Query: %s", params["query"])
+                logger.info("Keywords: %s...", ", ".join(params["keywords"][:5]))  # Show first 5 keywords
+
+                # Create a temporary source for this category
+                temp_source = NewsAPISource(
+                    name=f"{category.value}_news",
+                    query=params["query"],
+                    category=None,  # Use get_everything like POC
+                    max_items=max_articles_per_category,
+                    enabled=True,
+                )
 
-        for category, params in query_params.items():
-            logger.info("--- Fetching %s News ---", category.value.upper())
-            logger.info("Query: %s", params["query"])
-            logger.info("Keywords: %s...", ", ".join(params["keywords"][:5]))  # Show first 5 keywords
-
-            # Create a temporary source for this category
-            temp_source = NewsAPISource(
-                name=f"{category.value}_news",
-                query=params["query"],
-                category=None,  # Use get_everything like POC
-                max_items=max_articles_per_category,
-                enabled=True,
-            )
+                futures.append((category, temp_source, executor.submit(self._query_articles, temp_source)))
 
-            # Fetch articles for this category
-            articles = self.fetch_articles(temp_source)
+        for category, temp_source, future in futures:
+            response = future.result()
+            articles = self._dedupe_articles(temp_source, response) if response else []
 
             # Add category information to each article
-            for article in articles:
-                article_dict = article.to_dict()
-                article_dict["category"] = category.value
-                article_dict["keywords"] = params["keywords"]
-                article_dict["collector"] = self.name
-                article_dict["collected_at"] = datetime.now().isoformat()
-                article_dict["source_type"] = "newsapi"
-                all_articles.append(article_dict)
+            all_articles.extend(self._build_article_dict(article, collected_at, category) for article in articles)
 
             total_articles += len(articles)
             logger.info("Found %s articles for %s", len(articles), category.value)
@@ -462,12 +573,12 @@ class NewsAPICollector(BaseCollector):
             return []
 
         params = query_params[category]
+        self.keywords_by_category[category.value] = params["keywords"]
         logger.info("=== Fetching %s News ===", category.value.upper())
         logger.info("Query: %s", params["query"])
 
         # Clear cache to avoid deduplication issues with single category fetching
-        original_cache_size = len(self.articles_cache)
-        self.articles_cache.clear()
+        original_cache_size = self.clear_cache()
         logger.info("Cleared cache (was %s items) for single category fetching", original_cache_size)
 
         # Create a temporary source for this category
@@ -480,17 +591,10 @@ class NewsAPICollector(BaseCollector):
         )
 
         articles = self.fetch_articles(temp_source)
-        all_articles = []
+        collected_at = datetime.now().isoformat()
 
         # Add category information to each article
-        for article in articles:
-            article_dict = article.to_dict()
-            article_dict["category"] = category.value
-            article_dict["keywords"] = params["keywords"]
-            article_dict["collector"] = self.name
-            article_dict["collected_at"] = datetime.now().isoformat()
-            article_dict["source_type"] = "newsapi"
-            all_articles.append(article_dict)
+        all_articles = [self._build_article_dict(article, collected_at, category) for article in articles]
 
         if all_articles:
             logger.info("Found %s articles for %s", len(all_articles), category.value)
@@ -499,19 +603,17 @@ class NewsAPICollector(BaseCollector):
 
         return all_articles
 
-    def cleanup_cache(self):
-        """Clean up old items from cache to prevent memory issues."""
-        # Keep only the last 1000 items
-        if len(self.articles_cache) > 1000:
-            # Remove oldest items (simple approach: keep last 1000)
-            cache_items = list(self.articles_cache.items())
-            self.articles_cache = dict(cache_items[-1000:])
-            logger.info("Cleaned up NewsAPI cache, kept last 1000 items")
+    def clear_cache(self) -> int:
+        """Clear all deduplication state and return the number of cached articles dropped."""
+        cache_size = len(self.articles_cache)
+        self.articles_cache.clear()
+        self.seen_urls.clear()
+        return cache_size
 
 
-def create_newsapi_collector(name: str = "NewsAPI Collector") -> NewsAPICollector:
+def create_newsapi_collector(name: str = "NewsAPI Collector", api_key: Optional[str] = None) -> NewsAPICollector:
     """Factory function to create a NewsAPI collector instance."""
-    return NewsAPICollector(name=name)
+    return NewsAPICollector(name=name, api_key=api_key)
 
 
 if __name__ == "__main__":
@@ -556,7 +658,8 @@ if __name__ == "__main__":
                 print(f"  {i}. {item['title'][:60]}...")
                 print(f"     Source: {item['source']}")
                 print(f"     Category: {item['category']}")
-                print(f"     Keywords: {', '.join(item.get('keywords', [])[:3])}...")
+                keywords = collector.keywords_by_category.get(item["category"], [])
+                print(f"     Keywords: {', '.join(keywords[:3])}...")
                 print()
 
         # Show source status
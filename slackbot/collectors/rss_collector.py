@@ -7,15 +7,25 @@ AI/ML, agentic systems, and technology development content.
 """
 
 import os
+import re
 import logging
 import hashlib
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+import heapq
+import time
+from email.utils import parsedate_tz, parsedate_to_datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from urllib.parse import urlparse
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
 # Third-party imports
 try:
     import feedparser
+    import requests
+    from requests.adapters import HTTPAdapter
 
     DEPENDENCIES_AVAILABLE = True
 except ImportError:
@@ -26,8 +36,96 @@ from .base_collector import BaseCollector
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on feed hosts fetched concurrently during one collection run; feeds on one host are fetched in turn
+RSS_MAX_WORKERS = 16
+
+# Seconds to wait on a feed server before giving up on that feed for this run
+RSS_REQUEST_TIMEOUT = 30
+
+# Dedup entries expire after a day; the size cap bounds memory if a run sees an unusual burst
+RSS_CACHE_TTL_SECONDS = 24 * 60 * 60
+RSS_CACHE_SIZE = 10000
+
+# Parsed rss_sources entries per config path with the mtime they were read at, so an unchanged config is parsed once
+_CONFIG_CACHE: Dict[str, Tuple[int, List[Dict[str, Any]]]] = {}
+
+# Keywords used to decide whether an entry is relevant to AI/ML and agentic systems
+AI_ML_KEYWORDS = (
+    # Core AI/ML terms
+    "artificial intelligence",
+    "ai",
+    "machine learning",
+    "ml",
+    "deep learning",
+    "neural network",
+    "transformer",
+    "gpt",
+    "llm",
+    "large language model",
+    "agentic",
+    "autonomous agent",
+    "multi-agent",
+    "reinforcement learning",
+    # Technology development terms
+    "software development",
+    "programming",
+    "coding",
+    "algorithm",
+    "data science",
+    "computer vision",
+    "natural language processing",
+    "nlp",
+    "robotics",
+    "automation",
+    "optimization",
+    "scalability",
+    "performance",
+    # Industry terms
+    "startup",
+    "venture capital",
+    "investment",
+    "innovation",
+    "research",
+    "academic",
+    "paper",
+    "conference",
+    "workshop",
+    "competition",
+)
+
+# Single alternation so relevance checks scan the content once instead of once per keyword
+_AI_ML_KEYWORDS_RE = re.compile("|".join(re.escape(keyword) for keyword in AI_ML_KEYWORDS))
+
+
+def _parse_entry_date(value: str) -> Optional[datetime]:
+    """
+    Parse an RSS/Atom entry date string.
+
+    Handles RFC 822 dates (``Mon, 06 Oct 2025 10:00:00 GMT``) and ISO 8601 dates
+    (``2025-10-06T10:00:00Z``).
+
+    Args:
+        value: Raw date string from the feed entry
+
+    Returns:
+        Parsed datetime, or None if the string is not a recognised date
+    """
+    value = value.strip()
+    # parsedate_tz returns None instead of raising, so RFC 822 detection needs no exception
+    if parsedate_tz(value) is not None:
+        try:
+            return parsedate_to_datetime(value)
+        except ValueError:
+            return None
+    if value[:4].isdigit():
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return None
 
-@dataclass
+
+@dataclass(slots=True)
 class RSSSource:
     """Represents an RSS feed source configuration."""
 
@@ -39,6 +137,8 @@ class RSSSource:
     enabled: bool = True
     priority: float = 1.0  # Higher priority for AI/ML focused sources
     ai_ml_focus: bool = True  # Whether this source focuses on AI/ML content
+    etag: Optional[str] = None  # ETag from the last successful fetch, sent back as If-None-Match
+    last_modified: Optional[str] = None  # Last-Modified from the last successful fetch, sent as If-Modified-Since
 
     def __post_init__(self):
         # Auto-detect AI/ML focus based on name and category
@@ -71,9 +171,18 @@ class RSSCollector(BaseCollector):
             return
 
         self.sources: List[RSSSource] = []
-        self.news_cache = {}  # For deduplication
+        # Content hash / URL -> time.monotonic() when first seen; insertion order is age order
+        self.news_cache: OrderedDict[str, float] = OrderedDict()  # For deduplication
+        self.seen_urls: OrderedDict[str, float] = OrderedDict()  # So re-titled reposts of a link are dropped too
         self.last_fetch_times = {}
 
+        # Shared keep-alive session: most default feeds live on medium.com, so connections are reused across feeds
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = feedparser.USER_AGENT
+        adapter = HTTPAdapter(pool_connections=RSS_MAX_WORKERS, pool_maxsize=RSS_MAX_WORKERS)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Load RSS sources
         if config_path and os.path.exists(config_path):
             self._load_sources_from_config(config_path)
@@ -375,12 +484,25 @@ class RSSCollector(BaseCollector):
     def _load_sources_from_config(self, config_path: str) -> None:
         """Load RSS sources from configuration file."""
         try:
-            import yaml
+            cache_key = os.path.abspath(config_path)
+            mtime = os.stat(config_path).st_mtime_ns
+            cached = _CONFIG_CACHE.get(cache_key)
 
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
+            if cached and cached[0] == mtime:
+                source_configs = cached[1]
+            else:
+                import yaml
 
-            for source_config in config.get("rss_sources", []):
+                # LibYAML's C loader when PyYAML was built with it; same safe semantics as safe_load
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                with open(config_path, "r") as f:
+                    config = yaml.load(f, Loader=loader)
+
+                source_configs = config.get("rss_sources", [])
+                _CONFIG_CACHE[cache_key] = (mtime, source_configs)
+
+            # Build fresh sources each time; they carry per-collector state such as enabled
+            for source_config in source_configs:
                 source = RSSSource(**source_config)
                 self.sources.append(source)
 
@@ -391,78 +513,69 @@ class RSSCollector(BaseCollector):
             logger.info("🔄 Falling back to default RSS sources")
             self._load_default_sources()
 
-    def _should_update_source(self, source: RSSSource) -> bool:
+    def _should_update_source(self, source: RSSSource, *, now: Optional[datetime] = None) -> bool:
         """Check if a source should be updated based on interval."""
-        if source.name not in self.last_fetch_times:
+        last_fetch = self.last_fetch_times.get(source.name)
+        if last_fetch is None:
             return True
 
-        last_fetch = self.last_fetch_times[source.name]
-        time_since_last = datetime.now() - last_fetch
+        if now is None:
+            now = datetime.now()
+        time_since_last = now - last_fetch
 
         return time_since_last.total_seconds() >= source.update_interval
 
     def _generate_content_hash(self, title: str, summary: str) -> str:
         """Generate a hash for content deduplication."""
         content = f"{title}:{summary}".lower().strip()
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+        # 64-bit digest: only an in-process dedup key, and collisions are negligible at feed volumes
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
 
     def _is_ai_ml_relevant(self, title: str, summary: str, category: str) -> bool:
         """Check if content is relevant to AI/ML and agentic systems."""
-        ai_ml_keywords = [
-            # Core AI/ML terms
-            "artificial intelligence",
-            "ai",
-            "machine learning",
-            "ml",
-            "deep learning",
-            "neural network",
-            "transformer",
-            "gpt",
-            "llm",
-            "large language model",
-            "agentic",
-            "autonomous agent",
-            "multi-agent",
-            "reinforcement learning",
-            # Technology development terms
-            "software development",
-            "programming",
-            "coding",
-            "algorithm",
-            "data science",
-            "computer vision",
-            "natural language processing",
-            "nlp",
-            "robotics",
-            "automation",
-            "optimization",
-            "scalability",
-            "performance",
-            # Industry terms
-            "startup",
-            "venture capital",
-            "investment",
-            "innovation",
-            "research",
-            "academic",
-            "paper",
-            "conference",
-            "workshop",
-            "competition",
-        ]
-
         content = f"{title} {summary} {category}".lower()
-        return any(keyword in content for keyword in ai_ml_keywords)
+        return _AI_ML_KEYWORDS_RE.search(content) is not None
+
+    def _fetch_host_feeds(self, sources: List[RSSSource]) -> List[List[Dict[str, Any]]]:
+        """Fetch feeds that share a host one after another, so each host sees one request at a time."""
+        return [self._fetch_rss_feed(source) for source in sources]
 
     def _fetch_rss_feed(self, source: RSSSource) -> List[Dict[str, Any]]:
-        """Fetch articles from a single RSS feed."""
+        """
+        Download and parse a single RSS feed.
+
+        Returns candidate articles without relevance filtering or deduplication;
+        those run in _dedupe_articles on the calling thread.
+        """
         articles = []
 
         try:
             logger.info("📡 Fetching RSS feed: %s", source.name)
 
-            # Parse the RSS feed
-            feed = feedparser.parse(source.url)
+            # Fetch over the shared session, sending the previous validators so unchanged feeds return 304
+            headers = {}
+            if source.etag:
+                headers["If-None-Match"] = source.etag
+            if source.last_modified:
+                headers["If-Modified-Since"] = source.last_modified
+
+            response = self.session.get(source.url, headers=headers, timeout=RSS_REQUEST_TIMEOUT)
+
+            if response.status_code == 304:
+                logger.info("⏸️ RSS feed unchanged since last fetch: %s", source.name)
+                self.last_fetch_times[source.name] = datetime.now()
+                return articles
+
+            response.raise_for_status()
+
+            source.etag = response.headers.get("ETag")
+            source.last_modified = response.headers.get("Last-Modified")
+
+            # Parse the downloaded feed; the headers let feedparser pick the declared encoding and base URL.
+            # Summaries are fed to the summarizer as text, so skip feedparser's relative-URI rewrite pass
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            response_headers.setdefault("content-location", response.url)
+            feed = feedparser.parse(response.content, response_headers=response_headers, resolve_relative_uris=False)
 
             if feed.bozo:
                 logger.warning("⚠️ RSS parsing issues for %s: %s", source.name, feed.bozo_exception)
@@ -472,7 +585,10 @@ class RSSCollector(BaseCollector):
                 return articles
 
             # Process feed entries
-            for entry in feed.entries[: source.max_items]:
+            # One timestamp per feed fetch, reused for collected_at, undated entries and the fetch time
+            fetched_at = datetime.now()
+            collected_at = fetched_at.isoformat()
+            for entry in islice(feed.entries, source.max_items):
                 try:
                     # Extract basic information
                     title = getattr(entry, "title", "").strip()
@@ -480,36 +596,12 @@ class RSSCollector(BaseCollector):
                     summary = getattr(entry, "summary", "").strip()
 
                     # Handle different date formats
-                    published_date = None
-                    if hasattr(entry, "published_parsed") and entry.published_parsed:
-                        published_date = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, "published"):
-                        try:
-                            # Try to parse various date formats
-                            date_str = entry.published.replace("Z", "+00:00")
-                            for fmt in ["%a, %d %b %Y %H:%M:%S %z", "%Y-%m-%dT%H:%M:%S%z"]:
-                                try:
-                                    published_date = datetime.strptime(date_str, fmt)
-                                    break
-                                except ValueError:
-                                    continue
-                            if not published_date:
-                                published_date = datetime.now()
-                        except:
-                            published_date = datetime.now()
+                    published_parsed = getattr(entry, "published_parsed", None)
+                    if published_parsed:
+                        published_date = datetime(*published_parsed[:6])
                     else:
-                        published_date = datetime.now()
-
-                    # Check AI/ML relevance
-                    if not self._is_ai_ml_relevant(title, summary, source.category):
-                        continue
-
-                    # Generate content hash for deduplication
-                    content_hash = self._generate_content_hash(title, summary)
-
-                    # Check if we've seen this content before
-                    if content_hash in self.news_cache:
-                        continue
+                        published = getattr(entry, "published", None)
+                        published_date = (_parse_entry_date(published) if published else None) or fetched_at
 
                     # Create article dictionary
                     article = {
@@ -522,29 +614,66 @@ class RSSCollector(BaseCollector):
                         "published_at": published_date.isoformat(),
                         "priority": source.priority,
                         "ai_ml_focus": source.ai_ml_focus,
-                        "content_hash": content_hash,
-                        "collected_at": datetime.now().isoformat(),
+                        "collected_at": collected_at,
                     }
 
                     articles.append(article)
 
-                    # Cache the content hash
-                    self.news_cache[content_hash] = datetime.now()
-
                 except Exception as e:
                     logger.warning("⚠️ Error processing RSS entry from %s: %s", source.name, e)
                     continue
 
             # Update last fetch time
-            self.last_fetch_times[source.name] = datetime.now()
-
-            logger.info("✅ Fetched %s articles from %s", len(articles), source.name)
+            self.last_fetch_times[source.name] = fetched_at
 
         except Exception as e:
             logger.error("❌ Error fetching RSS feed %s: %s", source.name, e)
 
         return articles
 
+    def _dedupe_articles(self, source: RSSSource, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Keep the relevant candidates from a feed that have not been collected yet.
+
+        Runs on the calling thread in source order, so a story syndicated on several
+        feeds is always attributed to the first source that carries it.
+        """
+        articles = []
+
+        for article in candidates:
+            title = article["title"]
+            summary = article["summary"]
+            link = article["url"]
+
+            # Check AI/ML relevance
+            if not self._is_ai_ml_relevant(title, summary, source.category):
+                continue
+
+            # Generate content hash for deduplication
+            content_hash = self._generate_content_hash(title, summary)
+
+            # Check if we've seen this content or link before
+            if content_hash in self.news_cache or link in self.seen_urls:
+                continue
+
+            # Cache the content hash and link
+            seen_at = time.monotonic()
+            self.news_cache[content_hash] = seen_at
+            if len(self.news_cache) > RSS_CACHE_SIZE:
+                self.news_cache.popitem(last=False)
+            if link:
+                self.seen_urls[link] = seen_at
+                if len(self.seen_urls) > RSS_CACHE_SIZE:
+                    self.seen_urls.popitem(last=False)
+
+            article["content_hash"] = content_hash
+            articles.append(article)
+
+        if candidates:
+            logger.info("✅ Fetched %s articles from %s", len(articles), source.name)
+
+        return articles
+
     def collect(self, max_articles: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
         """
         Collect articles from RSS feeds.
@@ -564,24 +693,46 @@ class RSSCollector(BaseCollector):
 
         all_articles = []
 
-        # Collect from each source
+        due_sources = []
+        now = datetime.now()  # One clock read for every due check in this run
         for source in self.sources:
             if not source.enabled:
                 continue
 
-            if not self._should_update_source(source):
+            if not self._should_update_source(source, now=now):
                 logger.debug("⏰ Skipping %s (not due for update)", source.name)
                 continue
 
-            articles = self._fetch_rss_feed(source)
-            all_articles.extend(articles)
+            due_sources.append(source)
+
+        # Feed downloads are network-bound, so different hosts are fetched concurrently while
+        # feeds on the same host run one after another in a single task, keeping workers busy
+        sources_by_host: Dict[str, List[RSSSource]] = {}
+        for source in due_sources:
+            sources_by_host.setdefault(urlparse(source.url).netloc.lower(), []).append(source)
+
+        fetched: Dict[int, List[Dict[str, Any]]] = {}
+        if sources_by_host:
+            workers = min(len(sources_by_host), RSS_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss") as executor:
+                host_groups = list(sources_by_host.values())
+                for host_sources, host_results in zip(host_groups, executor.map(self._fetch_host_feeds, host_groups)):
+                    for source, candidates in zip(host_sources, host_results):
+                        fetched[id(source)] = candidates
 
-        # Sort by priority and recency
-        all_articles.sort(key=lambda x: (x.get("priority", 0), x.get("published_at", "")), reverse=True)
+        # Deduplicate in source order so cross-feed duplicates always resolve the same way
+        for source in due_sources:
+            all_articles.extend(self._dedupe_articles(source, fetched[id(source)]))
+
+        # Sort by priority and recency, applying the max_articles limit
+        def rank_key(article: Dict[str, Any]):
+            return (article.get("priority", 0), article.get("published_at", ""))
 
-        # Apply max_articles limit
         if max_articles:
-            all_articles = all_articles[:max_articles]
+            # Only the top max_articles are kept, so select them with a heap instead of sorting everything
+            all_articles = heapq.nlargest(max_articles, all_articles, key=rank_key)
+        else:
+            all_articles.sort(key=rank_key, reverse=True)
 
         # Clean up old cache entries (older than 24 hours)
         self._cleanup_cache()
@@ -591,14 +742,19 @@ class RSSCollector(BaseCollector):
 
     def _cleanup_cache(self) -> None:
         """Clean up old cache entries to prevent memory bloat."""
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        old_hashes = [hash_key for hash_key, timestamp in self.news_cache.items() if timestamp < cutoff_time]
+        cutoff_time = time.monotonic() - RSS_CACHE_TTL_SECONDS
+        removed = 0
+
+        # Entries are stored oldest first, so expiry only touches the entries it removes
+        while self.news_cache and next(iter(self.news_cache.values())) < cutoff_time:
+            self.news_cache.popitem(last=False)
+            removed += 1
 
-        for hash_key in old_hashes:
-            del self.news_cache[hash_key]
+        while self.seen_urls and next(iter(self.seen_urls.values())) < cutoff_time:
+            self.seen_urls.popitem(last=False)
 
-        if old_hashes:
-            logger.debug("🧹 Cleaned up %s old cache entries", len(old_hashes))
+        if removed:
+            logger.debug("🧹 Cleaned up %s old cache entries", removed)
 
     def get_source_status(self) -> Dict[str, Any]:
         """Get status of all RSS sources."""
@@ -7,6 +7,7 @@ result aggregation.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -139,6 +140,36 @@ class AggregationService:
             collector.error_count += 1
             raise
 
+    def _collect_concurrently(self, source_kwargs: Dict[str, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Collect from several sources at once, one worker thread per collector.
+
+        Args:
+            source_kwargs: Mapping of collector name to the arguments for its collection
+
+        Returns:
+            Mapping of collector name to collected items, in the order given;
+            collectors that fail are logged and left out
+        """
+        results = {}
+        if not source_kwargs:
+            return results
+
+        # Collectors are independent and network-bound, so their runs overlap
+        with ThreadPoolExecutor(max_workers=len(source_kwargs), thread_name_prefix="collector") as executor:
+            futures = {
+                source_name: executor.submit(self.collect_from_source, source_name, **kwargs)
+                for source_name, kwargs in source_kwargs.items()
+            }
+
+        for source_name, future in futures.items():
+            try:
+                results[source_name] = future.result()
+            except Exception as e:
+                logger.error("❌ Failed to collect from %s: %s", source_name, e)
+
+        return results
+
     def collect_from_all_sources(self, max_articles_per_source: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
         """
         Collect news from all available sources.
@@ -152,18 +183,15 @@ class AggregationService:
         """
         all_articles = []
 
-        for source_name in self.get_available_collectors():
-            try:
-                source_kwargs = kwargs.copy()
-                if max_articles_per_source:
-                    source_kwargs["max_articles"] = max_articles_per_source
-
-                articles = self.collect_from_source(source_name, **source_kwargs)
-                all_articles.extend(articles)
+        source_kwargs = kwargs.copy()
+        if max_articles_per_source:
+            source_kwargs["max_articles"] = max_articles_per_source
 
-            except Exception as e:
-                logger.error("❌ Failed to collect from %s: %s", source_name, e)
-                continue
+        results = self._collect_concurrently(
+            {source_name: source_kwargs for source_name in self.get_available_collectors()}
+        )
+        for articles in results.values():
+            all_articles.extend(articles)
 
         logger.info("📊 Total articles collected from all sources: %s", len(all_articles))
         return all_articles
@@ -204,31 +232,28 @@ class AggregationService:
             remaining_articles = 0
 
         balanced_articles = []
+        source_limits = {}
+        source_kwargs = {}
 
         for i, source_name in enumerate(available_sources):
-            try:
-                if articles_per_source is None:
-                    # No limit - collect all available articles
-                    source_limit = None
-                else:
-                    # Add extra articles to first few sources if there are remaining
-                    source_limit = articles_per_source + (1 if i < remaining_articles else 0)
-
-                source_kwargs = kwargs.copy()
-                source_kwargs["max_articles"] = source_limit
-
-                articles = self.collect_from_source(source_name, **source_kwargs)
+            if articles_per_source is None:
+                # No limit - collect all available articles
+                source_limit = None
+            else:
+                # Add extra articles to first few sources if there are remaining
+                source_limit = articles_per_source + (1 if i < remaining_articles else 0)
 
-                if source_limit is not None:
-                    balanced_articles.extend(articles[:source_limit])
-                    logger.info("📊 %s: collected %s articles", source_name, len(articles[:source_limit]))
-                else:
-                    balanced_articles.extend(articles)
-                    logger.info("📊 %s: collected %s articles", source_name, len(articles))
+            source_limits[source_name] = source_limit
+            source_kwargs[source_name] = {**kwargs, "max_articles": source_limit}
 
-            except Exception as e:
-                logger.error("❌ Failed to collect from %s: %s", source_name, e)
-                continue
+        for source_name, articles in self._collect_concurrently(source_kwargs).items():
+            source_limit = source_limits[source_name]
+            if source_limit is not None:
+                balanced_articles.extend(articles[:source_limit])
+                logger.info("📊 %s: collected %s articles", source_name, len(articles[:source_limit]))
+            else:
+                balanced_articles.extend(articles)
+                logger.info("📊 %s: collected %s articles", source_name, len(articles))
 
         # Ensure we don't exceed max_articles if specified
         if max_articles is not None:
@@ -273,8 +298,8 @@ class AggregationService:
 
                 # Clear cache before collecting to ensure fresh articles
                 newsapi_collector = self.collectors["newsapi"]
-                if hasattr(newsapi_collector, "articles_cache"):
-                    newsapi_collector.articles_cache.clear()
+                if hasattr(newsapi_collector, "clear_cache"):
+                    newsapi_collector.clear_cache()
                     logger.info("🧹 Cleared NewsAPI cache for fresh collection")
 
                 newsapi_articles = self.collect_from_source("newsapi", **newsapi_kwargs)
@@ -7,6 +7,7 @@ It handles summarization strategy selection, content processing, and result form
 """
 
 import logging
+from collections import Counter
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
@@ -201,6 +202,8 @@ class ContentProcessingService:
 
         logger.info("📝 Batch summarizing %s articles", len(articles))
 
+        # The provider cannot change during the batch, so look it up once
+        provider = self.get_provider_info()["provider"]
         results = []
         for i, article in enumerate(articles):
             try:
@@ -210,7 +213,7 @@ class ContentProcessingService:
                 results.append(tldr)
 
                 if tldr:
-                    logger.info("    ✅ Summary created using %s", self.get_provider_info()["provider"])
+                    logger.info("    ✅ Summary created using %s", provider)
                 else:
                     logger.warning("    ⚠️ Summary creation failed")
 
@@ -302,11 +305,10 @@ class ContentProcessingService:
 
             # Log ranking summary
             if reranked:
-                summary = self.reranker.get_ranking_summary(reranked)
                 logger.info("📊 Reranking complete. Top source: %s", reranked[0].get("source_type", "unknown"))
 
-                # Log source distribution
-                source_dist = summary.get("source_distribution", {})
+                # Log source distribution; counted directly since the full ranking summary rescores every article
+                source_dist = Counter(article.get("source_type", "unknown") for article in reranked)
                 for source_type, count in source_dist.items():
                     logger.info("  %s: %s articles", source_type, count)
 
@@ -7,12 +7,135 @@ and research papers based on source type, recency, and other factors.
 """
 
 import logging
+from collections import Counter
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime, timezone
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# RankingConfig field holding the weight for each source type; unknown sources get DEFAULT_SOURCE_WEIGHT
+SOURCE_WEIGHT_FIELDS = {
+    "newsapi": "newsapi_weight",
+    "arxiv": "arxiv_weight",
+    "rss": "rss_weight",
+}
+DEFAULT_SOURCE_WEIGHT = 0.5
+
+# AI/ML and agentic systems keywords with weights, built once rather than per scored article
+AI_ML_KEYWORD_WEIGHTS = {
+    # Core AI/ML terms (highest weight)
+    "artificial intelligence": 1.0,
+    "ai": 1.0,
+    "machine learning": 1.0,
+    "ml": 1.0,
+    "deep learning": 1.0,
+    "neural network": 1.0,
+    "transformer": 1.0,
+    "gpt": 1.0,
+    "llm": 1.0,
+    "large language model": 1.0,
+    # Agentic systems (highest weight)
+    "agentic": 1.0,
+    "autonomous agent": 1.0,
+    "multi-agent": 1.0,
+    "agent-based": 1.0,
+    "intelligent agent": 1.0,
+    "autonomous system": 1.0,
+    "agent framework": 1.0,
+    "agent orchestration": 1.0,
+    # RAG and Vector Systems (highest weight)
+    "rag": 1.0,
+    "retrieval augmented generation": 1.0,
+    "retrieval-augmented": 1.0,
+    "vector database": 1.0,
+    "vector search": 1.0,
+    "embedding": 1.0,
+    "semantic search": 1.0,
+    "knowledge base": 1.0,
+    "document retrieval": 1.0,
+    "context window": 1.0,
+    # LangChain and AI Frameworks
+    "langchain": 1.0,
+    "lang chain": 1.0,
+    "llama index": 1.0,
+    "haystack": 1.0,
+    "transformers": 1.0,
+    "hugging face": 1.0,
+    "openai": 1.0,
+    "anthropic": 1.0,
+    "claude": 1.0,
+    "gemini": 1.0,
+    # Software Development & AI Engineering
+    "software development": 0.95,
+    "programming": 0.95,
+    "coding": 0.95,
+    "api": 0.9,
+    "rest api": 0.9,
+    "graphql": 0.9,
+    "microservices": 0.9,
+    "docker": 0.85,
+    "kubernetes": 0.85,
+    "devops": 0.85,
+    "ci/cd": 0.85,
+    "cloud computing": 0.85,
+    "aws": 0.85,
+    "azure": 0.85,
+    "gcp": 0.85,
+    # Programming Languages & Tools
+    "python": 0.9,
+    "javascript": 0.9,
+    "typescript": 0.9,
+    "java": 0.85,
+    "go": 0.85,
+    "rust": 0.85,
+    "sql": 0.9,
+    "nosql": 0.85,
+    "mongodb": 0.85,
+    "postgresql": 0.85,
+    "redis": 0.85,
+    # Advanced AI concepts
+    "reinforcement learning": 0.95,
+    "computer vision": 0.95,
+    "natural language processing": 0.95,
+    "nlp": 0.95,
+    "robotics": 0.95,
+    "automation": 0.9,
+    "optimization": 0.9,
+    "scalability": 0.9,
+    "performance": 0.9,
+    "model training": 0.95,
+    "inference": 0.9,
+    "deployment": 0.9,
+    "mlops": 0.9,
+    "model serving": 0.9,
+    "a/b testing": 0.85,
+    # Data & Analytics
+    "data science": 0.95,
+    "data engineering": 0.9,
+    "etl": 0.85,
+    "data pipeline": 0.9,
+    "data warehouse": 0.85,
+    "data lake": 0.85,
+    "analytics": 0.9,
+    "business intelligence": 0.85,
+    "dashboard": 0.8,
+    # Industry and research
+    "startup": 0.8,
+    "venture capital": 0.8,
+    "investment": 0.8,
+    "innovation": 0.85,
+    "research": 0.9,
+    "academic": 0.9,
+    "paper": 0.9,
+    "conference": 0.85,
+    "workshop": 0.85,
+    "competition": 0.8,
+    "hackathon": 0.85,
+    "open source": 0.9,
+    "github": 0.85,
+}
+
 
 @dataclass
 class RankingConfig:
@@ -89,6 +212,13 @@ class ArticleReranker:
             config: Ranking configuration, uses defaults if None
         """
         self.config = config or RankingConfig()
+
+        # Scoring function used by each ranking strategy
+        self._strategy_scorers: Dict[str, Callable[[Dict[str, Any]], float]] = {
+            "smart": self.calculate_total_score,  # Use all ranking factors
+            "source_priority": self.calculate_source_score,  # Only consider source type
+            "recency": self.calculate_recency_score,  # Only consider recency
+        }
         logger.info("Initializing ArticleReranker")
 
     def calculate_source_score(self, article: Dict[str, Any]) -> float:
@@ -101,17 +231,12 @@ class ArticleReranker:
         Returns:
             Source type score (higher = better)
         """
-        source_type = article.get("source_type", "").lower()
-
-        if source_type == "newsapi":
-            return self.config.newsapi_weight
-        elif source_type == "arxiv":
-            return self.config.arxiv_weight
-        elif source_type == "rss":
-            return self.config.rss_weight
-        else:
+        weight_field = SOURCE_WEIGHT_FIELDS.get(article.get("source_type", "").lower())
+        if weight_field is None:
             # Default weight for unknown sources
-            return 0.5
+            return DEFAULT_SOURCE_WEIGHT
+
+        return getattr(self.config, weight_field)
 
     def calculate_recency_score(self, article: Dict[str, Any]) -> float:
         """
@@ -231,124 +356,10 @@ class ArticleReranker:
         summary = article.get("summary", "").lower()
         category = article.get("category", "").lower()
 
-        # AI/ML and agentic systems keywords with weights
-        ai_ml_keywords = {
-            # Core AI/ML terms (highest weight)
-            "artificial intelligence": 1.0,
-            "ai": 1.0,
-            "machine learning": 1.0,
-            "ml": 1.0,
-            "deep learning": 1.0,
-            "neural network": 1.0,
-            "transformer": 1.0,
-            "gpt": 1.0,
-            "llm": 1.0,
-            "large language model": 1.0,
-            # Agentic systems (highest weight)
-            "agentic": 1.0,
-            "autonomous agent": 1.0,
-            "multi-agent": 1.0,
-            "agent-based": 1.0,
-            "intelligent agent": 1.0,
-            "autonomous system": 1.0,
-            "agent framework": 1.0,
-            "agent orchestration": 1.0,
-            # RAG and Vector Systems (highest weight)
-            "rag": 1.0,
-            "retrieval augmented generation": 1.0,
-            "retrieval-augmented": 1.0,
-            "vector database": 1.0,
-            "vector search": 1.0,
-            "embedding": 1.0,
-            "semantic search": 1.0,
-            "knowledge base": 1.0,
-            "document retrieval": 1.0,
-            "context window": 1.0,
-            # LangChain and AI Frameworks
-            "langchain": 1.0,
-            "lang chain": 1.0,
-            "llama index": 1.0,
-            "haystack": 1.0,
-            "transformers": 1.0,
-            "hugging face": 1.0,
-            "openai": 1.0,
-            "anthropic": 1.0,
-            "claude": 1.0,
-            "gemini": 1.0,
-            # Software Development & AI Engineering
-            "software development": 0.95,
-            "programming": 0.95,
-            "coding": 0.95,
-            "api": 0.9,
-            "rest api": 0.9,
-            "graphql": 0.9,
-            "microservices": 0.9,
-            "docker": 0.85,
-            "kubernetes": 0.85,
-            "devops": 0.85,
-            "ci/cd": 0.85,
-            "cloud computing": 0.85,
-            "aws": 0.85,
-            "azure": 0.85,
-            "gcp": 0.85,
-            # Programming Languages & Tools
-            "python": 0.9,
-            "javascript": 0.9,
-            "typescript": 0.9,
-            "java": 0.85,
-            "go": 0.85,
-            "rust": 0.85,
-            "sql": 0.9,
-            "nosql": 0.85,
-            "mongodb": 0.85,
-            "postgresql": 0.85,
-            "redis": 0.85,
-            # Advanced AI concepts
-            "reinforcement learning": 0.95,
-            "computer vision": 0.95,
-            "natural language processing": 0.95,
-            "nlp": 0.95,
-            "robotics": 0.95,
-            "automation": 0.9,
-            "optimization": 0.9,
-            "scalability": 0.9,
-            "performance": 0.9,
-            "model training": 0.95,
-            "inference": 0.9,
-            "deployment": 0.9,
-            "mlops": 0.9,
-            "model serving": 0.9,
-            "a/b testing": 0.85,
-            # Data & Analytics
-            "data science": 0.95,
-            "data engineering": 0.9,
-            "etl": 0.85,
-            "data pipeline": 0.9,
-            "data warehouse": 0.85,
-            "data lake": 0.85,
-            "analytics": 0.9,
-            "business intelligence": 0.85,
-            "dashboard": 0.8,
-            # Industry and research
-            "startup": 0.8,
-            "venture capital": 0.8,
-            "investment": 0.8,
-            "innovation": 0.85,
-            "research": 0.9,
-            "academic": 0.9,
-            "paper": 0.9,
-            "conference": 0.85,
-            "workshop": 0.85,
-            "competition": 0.8,
-            "hackathon": 0.85,
-            "open source": 0.9,
-            "github": 0.85,
-        }
-
         content = f"{title} {summary} {category}"
         max_score = 0.0
 
-        for keyword, weight in ai_ml_keywords.items():
+        for keyword, weight in AI_ML_KEYWORD_WEIGHTS.items():
             if keyword in content:
                 max_score = max(max_score, weight)
 
@@ -397,53 +408,13 @@ class ArticleReranker:
 
         logger.info("🔄 Reranking %s articles using strategy: %s", len(articles), strategy)
 
-        if strategy == "smart":
-            # Use all ranking factors
-            scored_articles = []
-            for article in articles:
-                score = self.calculate_total_score(article)
-                scored_articles.append((article, score))
-
-            # Sort by score (highest first)
-            scored_articles.sort(key=lambda x: x[1], reverse=True)
-
-        elif strategy == "source_priority":
-            # Only consider source type
-            scored_articles = []
-            for article in articles:
-                score = self.calculate_source_score(article)
-                scored_articles.append((article, score))
-
-            scored_articles.sort(key=lambda x: x[1], reverse=True)
-
-        elif strategy == "recency":
-            # Only consider recency
-            scored_articles = []
-            for article in articles:
-                score = self.calculate_recency_score(article)
-                scored_articles.append((article, score))
-
-            scored_articles.sort(key=lambda x: x[1], reverse=True)
-
-        # elif strategy == "custom":
-        #     # Use custom ranking function if provided
-        #     custom_ranker = getattr(self, "custom_ranking_function", None)
-        #     if custom_ranker and callable(custom_ranker):
-        #         scored_articles = []
-        #         for article in articles:
-        #             score = custom_ranker(article)
-        #             scored_articles.append((article, score))
-
-        #         scored_articles.sort(key=lambda x: x[1], reverse=True)
-        #     else:
-        #         logger.warning("Custom ranking strategy requested but no custom function found")
-        #         return articles
-        else:
+        scorer = self._strategy_scorers.get(strategy)
+        if scorer is None:
             logger.warning("Unknown ranking strategy: %s, returning original order", strategy)
             return articles
 
-        # Extract articles from scored tuples
-        reranked_articles = [article for article, score in scored_articles]
+        # Sort by score (highest first); the sort is stable, so ties keep their input order
+        reranked_articles = sorted(articles, key=scorer, reverse=True)
 
         # Log ranking summary
         if reranked_articles:
@@ -466,16 +437,9 @@ class ArticleReranker:
         if not articles:
             return {"message": "No articles to analyze"}
 
-        # Count by source type
-        source_counts = {}
-        category_counts = {}
-
-        for article in articles:
-            source_type = article.get("source_type", "unknown")
-            source_counts[source_type] = source_counts.get(source_type, 0) + 1
-
-            category = article.get("category", "unknown")
-            category_counts[category] = category_counts.get(category, 0) + 1
+        # Count by source type and category
+        source_counts = Counter(article.get("source_type", "unknown") for article in articles)
+        category_counts = Counter(article.get("category", "unknown") for article in articles)
 
         # Calculate average scores
         total_scores = []
@@ -489,8 +453,8 @@ class ArticleReranker:
 
         return {
             "total_articles": len(articles),
-            "source_distribution": source_counts,
-            "category_distribution": category_counts,
+            "source_distribution": dict(source_counts),
+            "category_distribution": dict(category_counts),
             "score_statistics": {
                 "average": round(avg_score, 3),
                 "minimum": round(min_score, 3),